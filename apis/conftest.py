@@ -0,0 +1,47 @@
+"""
+Shared test setup for the Mistral AI client tests.
+
+Pytest imports this module once per session, before collecting the test
+modules in this directory. The test modules also import it so they keep
+working when run directly as scripts.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Directory holding mistral_client.py and its tests, resolved once
+HERE = Path(__file__).resolve().parent
+
+# Make mistral_client importable from the tests
+sys.path.insert(0, str(HERE))
+
+_MISTRALAI_MODULES = ('mistralai', 'mistralai.client', 'mistralai.models.chat_completion')
+
+
+class MistralStubTestCase(unittest.TestCase):
+    """
+    TestCase that stands in for the mistralai library while its tests run.
+    
+    Each subclass installs its own stubs in setUpClass and restores the
+    previous modules in tearDownClass, so no TestCase depends on state left
+    behind by another and the suite can run in parallel (pytest -n auto).
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Install MagicMock stand-ins for the mistralai modules."""
+        super().setUpClass()
+        cls._saved_modules = {name: sys.modules.get(name) for name in _MISTRALAI_MODULES}
+        sys.modules.update({name: MagicMock() for name in _MISTRALAI_MODULES})
+    
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Restore the modules replaced in setUpClass."""
+        for name, module in cls._saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        super().tearDownClass()
@@ -24,8 +24,21 @@ License: MIT
 """
 
 import os
+import re
 import sys
-from typing import Optional, List, Dict, Any, Tuple
+import json
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import math
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 import logging
 
 # Configure logging to avoid sensitive data exposure
@@ -36,14 +49,755 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-try:
-    from mistralai.client import MistralClient
-    from mistralai.models.chat_completion import ChatMessage
-    MISTRAL_AVAILABLE = True
-except ImportError:
-    MISTRAL_AVAILABLE = False
+# Recommended Mistral model for each kind of workload
+MODELS_BY_USE_CASE: Dict[str, str] = {
+    "realtime_chat": "mistral-small-latest",
+    "reasoning": "mistral-large-latest",
+    "coding": "codestral-latest",
+    "lightweight": "ministral-3b-latest",
+}
+
+# Default generation limits; shorter answers are proportionally faster to generate
+_DEFAULT_MAX_TOKENS = 150
+_DEFAULT_SYSTEM_PROMPT = "Respond concisely, under 120 words."
+
+# Sensitive values redacted before logging: group 1 is a GitHub token, group 2 an API key.
+# The key stops before an embedded token prefix, so a token written straight after a key
+# is still redacted as a token rather than partly swallowed by the key
+_SANITIZE_RE = re.compile(r'(gh[a-z]_[A-Za-z0-9_]{36,})|(sk-(?:(?!gh[a-z]_)[A-Za-z0-9]){48,})')
+
+# GitHub tokens have specific prefixes
+_VALID_TOKEN_PREFIXES = ('ghp_', 'gho_', 'ghu_', 'ghs_')
+
+# Example messages to demonstrate the functionality
+_DEMO_MESSAGES = [
+    "Hello, can you help me with a simple coding question?",
+    "What are the best practices for writing secure smart contracts?",
+    "Explain the difference between ERC-20 and ERC-721 tokens."
+]
+
+# Instruction and answer pattern for asking several questions in one request
+_COMBINED_PROMPT_HEADER = (
+    "Answer each of the following numbered questions briefly. "
+    "Prefix each answer with its number followed by a colon, e.g. '1: ...'.\n\n"
+)
+_ANSWER_PREFIX_RE = re.compile(r'^\s*(\d+):\s*', re.M)
+
+# Batch job polling: first delay, delay cap and overall limit in seconds
+_BATCH_POLL_INTERVAL = 2.0
+_BATCH_POLL_MAX_INTERVAL = 60.0
+_BATCH_TIMEOUT = 3600.0
+# Batch job states that mean the job is still in progress
+_BATCH_PENDING_STATUSES = ("QUEUED", "RUNNING")
+
+# Prompt asking a cheap model for likely follow-up questions to prefetch
+_FOLLOW_UP_PROMPT = (
+    "A user asked: {question}\n"
+    "The assistant answered: {answer}\n\n"
+    "List {count} short follow-up questions the user is likely to ask next, one per line."
+)
+_PREFETCH_COUNT = 3
+# Name of the prefetch worker thread, whose routine log lines are suppressed
+_PREFETCH_THREAD_NAME = "mistral-prefetch"
+_LIST_ITEM_RE = re.compile(r'^\s*(?:\d+[.):]|[-*•])?\s*')
+
+# Number of streamed tokens written between explicit stdout flushes
+_STREAM_FLUSH_EVERY = 32
+
+# Seconds after a successful API call during which health checks pass without a request
+_HEALTH_CHECK_TTL = 60.0
+
+# Seconds over which MistralClientPool's per-endpoint latency average decays
+_POOL_LATENCY_WINDOW = 60.0
+# Minimum weight of each new latency sample, so bursts still move the average
+_POOL_MIN_ALPHA = 0.2
+# Seconds added to the latency sample of a failed request, steering traffic away
+_POOL_FAILURE_PENALTY = 30.0
+
+# Rows of int8 embeddings widened at a time by the NumPy similarity scan, so the
+# temporary float32 copy stays small enough to remain in cache
+_SEMANTIC_SCAN_BLOCK = 1024
+
+
+class _QuietPrefetchFilter(logging.Filter):
+    """Drop routine log records from the prefetch thread so they do not interrupt the prompt."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.threadName != _PREFETCH_THREAD_NAME or record.levelno >= logging.WARNING
+
+
+logger.addFilter(_QuietPrefetchFilter())
+
+
+def _is_installed(name: str) -> bool:
+    """
+    Check whether a package can be imported without importing it.
+    
+    Args:
+        name: The top-level package name
+        
+    Returns:
+        bool: True if the package is installed or already imported
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ValueError:
+        # Already in sys.modules without a __spec__
+        return True
+
+
+# mistralai (and the httpx/pydantic stack behind it) and numpy are slow to import,
+# so they are only loaded on first use; the missing-token and help paths never pay for them
+MistralClient: Any = None
+ChatMessage: Any = None
+np: Any = None
+
+MISTRAL_AVAILABLE = _is_installed('mistralai')
+if not MISTRAL_AVAILABLE:
     logger.warning("mistralai library not found. Some functionality will be limited.")
 
+NUMPY_AVAILABLE = _is_installed('numpy')
+NUMBA_AVAILABLE = _is_installed('numba')
+
+# Compiled similarity scan, set by _load_numba() when numba is installed
+_topk_cosine: Any = None
+
+
+def _load_mistral() -> None:
+    """
+    Import the mistralai classes on first use.
+    
+    Raises:
+        ImportError: If mistralai is missing, or the installed version does not
+                     provide the 0.x client API
+    """
+    global MistralClient, ChatMessage
+    if MistralClient is not None and ChatMessage is not None:
+        return
+    
+    try:
+        from mistralai.client import MistralClient as _MistralClient
+        from mistralai.models.chat_completion import ChatMessage as _ChatMessage
+    except ImportError as e:
+        if not _is_installed('mistralai'):
+            raise ImportError(
+                "mistralai library not found. Please install it using: pip install mistralai"
+            ) from e
+        
+        # Only paid on this failure path, so importlib.metadata stays off the startup path
+        import importlib.metadata
+        try:
+            version = importlib.metadata.version('mistralai')
+        except importlib.metadata.PackageNotFoundError:
+            version = "unknown"
+        logger.warning(f"mistralai {version} is installed but not supported")
+        raise ImportError(
+            f"mistralai {version} is not supported; this client needs the 0.x API. "
+            "Please install it using: pip install 'mistralai<1'"
+        ) from e
+    
+    if MistralClient is None:
+        MistralClient = _MistralClient
+    if ChatMessage is None:
+        ChatMessage = _ChatMessage
+
+
+def _load_numpy() -> None:
+    """
+    Import numpy on first use.
+    
+    Raises:
+        ImportError: If numpy cannot be imported
+    """
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+
+
+def _load_numba() -> None:
+    """
+    Compile the semantic cache similarity scan with numba on first use.
+    
+    For the few thousand entries a semantic cache typically holds, a compiled
+    loop beats dispatching a NumPy matrix product per lookup. If numba is
+    missing, cannot be imported (e.g. it does not support the installed numpy)
+    or fails to compile the scan, _topk_cosine stays None and SemanticCache
+    uses NumPy.
+    """
+    global _topk_cosine, NUMBA_AVAILABLE
+    if _topk_cosine is not None or not NUMBA_AVAILABLE:
+        return
+    
+    _load_numpy()
+    try:
+        from numba import njit, prange
+        from numba.core.errors import NumbaError
+    except ImportError as e:
+        logger.warning(f"numba could not be imported, using NumPy for the semantic cache: {e}")
+        NUMBA_AVAILABLE = False
+        return
+    
+    @njit(cache=True, fastmath=True, parallel=True)
+    def topk_cosine(embs, scales, query, query_scale, threshold):
+        # Score rows in parallel, then pick the best serially to avoid racing on it
+        scores = np.empty(embs.shape[0], dtype=np.float32)
+        for i in prange(embs.shape[0]):
+            dot = np.int32(0)
+            for j in range(embs.shape[1]):
+                dot += np.int32(embs[i, j]) * np.int32(query[j])
+            scores[i] = dot * scales[i] * query_scale
+        
+        best_index = -1
+        best_score = threshold
+        for i in range(scores.shape[0]):
+            if scores[i] > best_score:
+                best_score = scores[i]
+                best_index = i
+        return best_index, best_score
+    
+    # Compile now (or load from the on-disk cache) instead of stalling the first lookup
+    try:
+        topk_cosine(
+            np.zeros((1, 384), np.int8), np.ones(1, np.float32),
+            np.zeros(384, np.int8), np.float32(1.0), 0.0
+        )
+    except NumbaError as e:
+        logger.warning(f"numba could not compile the similarity scan, using NumPy: {e}")
+        NUMBA_AVAILABLE = False
+        return
+    _topk_cosine = topk_cosine
+
+# Shared MistralClient instances keyed by API key, so every MistralGitHubClient
+# using the same key reuses one HTTP connection pool
+_CLIENT_CACHE: Dict[str, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _build_messages(content: str, system_prompt: Optional[str]) -> Tuple[Any, ...]:
+    """
+    Build the chat messages for a request, reusing them for repeated inputs.
+    
+    Args:
+        content: The user message to send to the AI model
+        system_prompt: Optional system instruction sent before the message
+        
+    Returns:
+        Tuple of ChatMessage objects
+    """
+    user_message = ChatMessage(role="user", content=content)
+    if system_prompt:
+        return (ChatMessage(role="system", content=system_prompt), user_message)
+    return (user_message,)
+
+
+def _get_shared_client(api_key: str) -> Any:
+    """
+    Get the process-wide MistralClient for an API key, creating it on first use.
+    
+    Args:
+        api_key: The API key used to authenticate with Mistral AI
+        
+    Returns:
+        MistralClient: The shared client instance
+    """
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = MistralClient(api_key=api_key)
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+
+class SemanticCache:
+    """
+    A response cache that matches messages by meaning rather than exact text.
+    
+    Messages are embedded with a local sentence-transformers model and a cached
+    response is reused when the cosine similarity to a previous message in the
+    same partition exceeds the threshold. MistralGitHubClient partitions by model
+    and generation settings, so a reply is never reused under a different
+    length limit or system prompt. Embeddings are stored quantized to
+    int8 with one scale per vector, a quarter of the memory (and of the memory
+    traffic during a scan) of float32. The similarity scan is compiled with
+    numba when it is installed; otherwise NumPy widens the rows in small blocks.
+    
+    Attributes:
+        threshold (float): Minimum cosine similarity for a cache hit
+        model_name (str): The sentence-transformers model used for embeddings
+        embs_i8 (Dict[str, np.ndarray]): Quantized embeddings (N x dim, int8) per partition
+        scales (Dict[str, np.ndarray]): Dequantization scale of each row of embs_i8
+        responses (Dict[str, List[Dict[str, Any]]]): Cached results aligned with embs_i8
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        encoder: Optional[Any] = None
+    ) -> None:
+        """
+        Initialize an empty semantic cache.
+        
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            model_name: The sentence-transformers model to load on first use
+            encoder: Optional preloaded encoder exposing encode(text, normalize_embeddings=True)
+            
+        Raises:
+            ImportError: If numpy, or sentence-transformers when no encoder is given,
+                         is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "numpy library not found. "
+                "Please install it using: pip install numpy sentence-transformers"
+            )
+        if encoder is None and not _is_installed('sentence_transformers'):
+            raise ImportError(
+                "sentence-transformers library not found. "
+                "Please install it using: pip install sentence-transformers onnxruntime"
+            )
+        _load_numpy()
+        _load_numba()
+        
+        self.threshold = threshold
+        self.model_name = model_name
+        self._encoder = encoder
+        self.embs_i8: Dict[str, "np.ndarray"] = {}
+        self.scales: Dict[str, "np.ndarray"] = {}
+        self.responses: Dict[str, List[Dict[str, Any]]] = {}
+    
+    @property
+    def encoder(self) -> Any:
+        """Load the ONNX sentence-transformers encoder on first use."""
+        if self._encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "sentence-transformers library not found. "
+                    "Please install it using: pip install sentence-transformers onnxruntime"
+                ) from e
+            self._encoder = SentenceTransformer(self.model_name, backend="onnx")
+        return self._encoder
+    
+    def encode(self, message: str) -> "np.ndarray":
+        """
+        Embed a message as a normalized vector.
+        
+        Args:
+            message: The message to embed
+            
+        Returns:
+            np.ndarray: The unit-length embedding
+        """
+        return np.asarray(self.encoder.encode(message, normalize_embeddings=True), dtype=np.float32)
+    
+    @staticmethod
+    def quantize(embedding: "np.ndarray") -> Tuple["np.ndarray", "np.float32"]:
+        """
+        Quantize an embedding to int8 with a per-vector scale.
+        
+        Args:
+            embedding: The embedding to quantize
+            
+        Returns:
+            Tuple of the int8 vector and the scale that maps it back to float
+        """
+        peak = float(np.max(np.abs(embedding)))
+        if peak == 0.0:
+            return np.zeros(embedding.shape, dtype=np.int8), np.float32(1.0)
+        quantized = np.round(embedding / peak * 127).astype(np.int8)
+        return quantized, np.float32(peak / 127)
+    
+    def lookup(self, embedding: "np.ndarray", partition: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached response for a semantically similar message.
+        
+        Args:
+            embedding: The normalized embedding of the new message
+            partition: The cache partition, e.g. the Mistral model the message is addressed to
+            
+        Returns:
+            A copy of the most similar cached result, or None if none is close enough
+        """
+        embs = self.embs_i8.get(partition)
+        if embs is None or not embs.size:
+            return None
+        
+        query, query_scale = self.quantize(embedding)
+        scales = self.scales[partition]
+        if _topk_cosine is not None:
+            best, _ = _topk_cosine(embs, scales, query, query_scale, float(self.threshold))
+            return None if best < 0 else dict(self.responses[partition][best])
+        
+        # NumPy has no int8 matmul that accumulates without overflow, so widen to
+        # float32 one block at a time rather than copying the whole matrix per query
+        query_f32 = query.astype(np.float32) * query_scale
+        best, best_score = -1, self.threshold
+        for start in range(0, embs.shape[0], _SEMANTIC_SCAN_BLOCK):
+            stop = start + _SEMANTIC_SCAN_BLOCK
+            similarities = (embs[start:stop].astype(np.float32) @ query_f32) * scales[start:stop]
+            index = int(np.argmax(similarities))
+            if similarities[index] > best_score:
+                best, best_score = start + index, similarities[index]
+        return None if best < 0 else dict(self.responses[partition][best])
+    
+    def add(self, embedding: "np.ndarray", partition: str, result: Dict[str, Any]) -> None:
+        """
+        Cache a successful result under the embedding of its message.
+        
+        Args:
+            embedding: The normalized embedding of the message
+            partition: The cache partition, e.g. the Mistral model that produced the result
+            result: The successful result dict to cache
+        """
+        quantized, scale = self.quantize(embedding)
+        embs = self.embs_i8.get(partition)
+        self.embs_i8[partition] = (
+            quantized[np.newaxis, :] if embs is None else np.vstack([embs, quantized])
+        )
+        self.scales[partition] = np.append(
+            self.scales.get(partition, np.empty(0, np.float32)), scale
+        )
+        self.responses.setdefault(partition, []).append(result)
+
+
+class DiskCache:
+    """
+    A persistent response cache stored in SQLite.
+    
+    Responses survive process restarts, so repeated CLI runs can reuse them
+    until they are older than the TTL; expired entries are deleted when the
+    database is opened. Database errors after opening, such as a locked or
+    full database, and unreadable entries are logged and treated as cache
+    misses or skipped writes.
+    
+    Attributes:
+        path (str): Location of the SQLite database
+        ttl (float): Maximum age of a cached response in seconds
+    """
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = 24 * 60 * 60) -> None:
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Database location. If None, uses the MISTRAL_CACHE_PATH environment
+                  variable or ~/.cache/mistral_client.db.
+            ttl: Maximum age of a cached response in seconds (default: one day)
+            
+        Raises:
+            OSError: If the cache directory cannot be created
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.path = path or os.getenv('MISTRAL_CACHE_PATH') or os.path.join(
+            os.path.expanduser('~'), '.cache', 'mistral_client.db'
+        )
+        self.ttl = ttl
+        
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS kv(k TEXT PRIMARY KEY, v BLOB, ts REAL)")
+            self._conn.execute("DELETE FROM kv WHERE ts <= ?", (time.time() - self.ttl,))
+    
+    @staticmethod
+    def _key(key: Tuple[str, str]) -> str:
+        """Flatten a (model, digest) cache key into a database key."""
+        return f"{key[0]}:{key[1]}"
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached result that has not expired.
+        
+        Args:
+            key: Cache key as built by MistralGitHubClient
+            
+        Returns:
+            The cached result dict, or None if missing, expired or unreadable
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT v FROM kv WHERE k = ? AND ts > ?",
+                    (self._key(key), time.time() - self.ttl)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            # ValueError covers JSONDecodeError and UnicodeDecodeError from corrupt entries
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+    
+    def set(self, key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        """
+        Store a result, replacing any previous entry for the key.
+        
+        Args:
+            key: Cache key as built by MistralGitHubClient
+            result: The successful result dict to cache
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO kv(k, v, ts) VALUES (?, ?, ?)",
+                    (self._key(key), json.dumps(result), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that limits the request rate.
+    
+    The bucket holds up to rpm tokens and refills continuously at rpm tokens
+    per minute. Each request takes one token, blocking until one is available,
+    so bursts are smoothed to the sustained rate instead of hitting 429 errors.
+    
+    Attributes:
+        rpm (int): Maximum requests per minute
+        tokens (float): Tokens currently available
+    """
+    
+    def __init__(self, rpm: int) -> None:
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rpm: Maximum requests per minute
+            
+        Raises:
+            ValueError: If rpm is not positive
+        """
+        if rpm <= 0:
+            raise ValueError("Requests per minute must be a positive integer")
+        
+        self.rpm = rpm
+        self.tokens = float(rpm)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until the bucket has refilled enough."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                refill = (now - self.last) * self.rpm / 60.0
+                self.tokens = min(float(self.rpm), self.tokens + refill)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * 60.0 / self.rpm
+            time.sleep(wait)
+
+
+class MistralClientPool:
+    """
+    A drop-in replacement for MistralClient that spreads requests over several endpoints.
+    
+    Each request goes to an endpoint picked at random, weighted by the inverse of
+    its recent latency, so faster endpoints take more of the load. If a request
+    fails before any data has been returned, it is retried on the remaining
+    endpoints in the same weighted order.
+    
+    Attributes:
+        clients (List[MistralClient]): One client per endpoint
+        fallback (bool): Whether failed requests are retried on other endpoints
+        latency (List[Optional[float]]): Moving average of request latency per endpoint
+            in seconds, None until the endpoint has served a request
+    """
+    
+    def __init__(
+        self,
+        clients: List[Any],
+        concurrency_limit: Optional[int] = None,
+        fallback: bool = True
+    ) -> None:
+        """
+        Initialize the pool.
+        
+        Args:
+            clients: Clients for each endpoint, e.g. Mistral directly, an Azure
+                     deployment and a self-hosted vLLM server
+            concurrency_limit: Maximum requests in flight per endpoint. If None,
+                               requests are not limited.
+            fallback: Retry a failed request on the next endpoint
+            
+        Raises:
+            ValueError: If no clients are given or the limit is not positive
+        """
+        if not clients:
+            raise ValueError("At least one client is required")
+        if concurrency_limit is not None and concurrency_limit <= 0:
+            raise ValueError("Concurrency limit must be a positive integer")
+        
+        self.clients = list(clients)
+        self.fallback = fallback
+        self.latency: List[Optional[float]] = [None] * len(self.clients)
+        self._updated = [0.0] * len(self.clients)
+        self._slots = [
+            threading.BoundedSemaphore(concurrency_limit) if concurrency_limit else None
+            for _ in self.clients
+        ]
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_endpoints(cls, endpoints: List[Tuple[str, str]], **kwargs: Any) -> "MistralClientPool":
+        """
+        Create a pool with one MistralClient per endpoint.
+        
+        Args:
+            endpoints: (base_url, api_key) pairs
+            **kwargs: Passed on to MistralClientPool
+            
+        Returns:
+            MistralClientPool: The new pool
+            
+        Raises:
+            ImportError: If mistralai library is not installed
+        """
+        _load_mistral()
+        return cls(
+            [MistralClient(api_key=api_key, endpoint=base_url) for base_url, api_key in endpoints],
+            **kwargs
+        )
+    
+    def _route(self) -> List[int]:
+        """
+        Order the endpoints for a request.
+        
+        Returns:
+            List of endpoint indices, sampled without replacement by inverse latency.
+            Endpoints without samples yet count as the fastest known one.
+        """
+        with self._lock:
+            known = [latency for latency in self.latency if latency is not None]
+            default = min(known) if known else 1.0
+            weights = [
+                1.0 / max(latency if latency is not None else default, 1e-3)
+                for latency in self.latency
+            ]
+        
+        remaining = list(range(len(self.clients)))
+        order = []
+        while remaining:
+            index = random.choices(remaining, weights=[weights[i] for i in remaining])[0]
+            remaining.remove(index)
+            order.append(index)
+        return order if self.fallback else order[:1]
+    
+    def _record(self, index: int, elapsed: float) -> None:
+        """
+        Fold a latency sample into an endpoint's moving average.
+        
+        Args:
+            index: The endpoint index
+            elapsed: Seconds the request took, including any failure penalty
+        """
+        now = time.monotonic()
+        with self._lock:
+            previous = self.latency[index]
+            if previous is None:
+                self.latency[index] = elapsed
+            else:
+                decay = math.exp(-(now - self._updated[index]) / _POOL_LATENCY_WINDOW)
+                alpha = max(_POOL_MIN_ALPHA, 1.0 - decay)
+                self.latency[index] = previous + alpha * (elapsed - previous)
+            self._updated[index] = now
+    
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        """
+        Call a client method on the routed endpoints until one succeeds.
+        
+        Args:
+            method: Name of the MistralClient method
+            **kwargs: Arguments for the method
+            
+        Returns:
+            The method's result from the first endpoint that succeeded
+        """
+        last_error: Optional[Exception] = None
+        for index in self._route():
+            slot = self._slots[index]
+            if slot:
+                slot.acquire()
+            start = time.monotonic()
+            try:
+                result = getattr(self.clients[index], method)(**kwargs)
+            except Exception as e:
+                self._record(index, time.monotonic() - start + _POOL_FAILURE_PENALTY)
+                logger.warning(f"Endpoint {index} failed: {type(e).__name__}")
+                last_error = e
+                continue
+            finally:
+                if slot:
+                    slot.release()
+            self._record(index, time.monotonic() - start)
+            return result
+        raise last_error
+    
+    def chat_stream(self, **kwargs: Any) -> Iterator[Any]:
+        """
+        Stream a chat completion from the routed endpoints.
+        
+        Failover only happens before the first chunk, since a partial answer
+        cannot be resumed on another endpoint. Latency is measured to the first
+        chunk.
+        
+        Args:
+            **kwargs: Arguments for MistralClient.chat_stream
+            
+        Yields:
+            Chat completion chunks
+        """
+        last_error: Optional[Exception] = None
+        for index in self._route():
+            slot = self._slots[index]
+            if slot:
+                slot.acquire()
+            start = time.monotonic()
+            started = False
+            try:
+                for chunk in self.clients[index].chat_stream(**kwargs):
+                    if not started:
+                        started = True
+                        self._record(index, time.monotonic() - start)
+                    yield chunk
+                if not started:
+                    self._record(index, time.monotonic() - start)
+                return
+            except Exception as e:
+                if started:
+                    raise
+                self._record(index, time.monotonic() - start + _POOL_FAILURE_PENALTY)
+                logger.warning(f"Endpoint {index} failed: {type(e).__name__}")
+                last_error = e
+            finally:
+                if slot:
+                    slot.release()
+        raise last_error
+    
+    def list_models(self) -> Any:
+        """
+        List the models available on the routed endpoint.
+        
+        Returns:
+            The model list from the first endpoint that answered
+        """
+        return self._call('list_models')
+
 
 class MistralGitHubClient:
     """
@@ -55,20 +809,44 @@ class MistralGitHubClient:
     
     Attributes:
         github_token (str): The GitHub personal access token (securely stored)
-        client (MistralClient): The initialized Mistral AI client
+        client (MistralClient): The initialized Mistral AI client, or a MistralClientPool
         is_connected (bool): Whether the client is successfully connected
+        max_cache_entries (int): Maximum number of responses kept in the exact-match cache
+        semantic_cache (Optional[SemanticCache]): Cache matching paraphrased messages
+        disk_cache (Optional[DiskCache]): Persistent cache shared across runs
+        rate_limiter (Optional[TokenBucket]): Client-side request rate limiter
     """
     
-    def __init__(self, github_token: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        max_cache_entries: int = 128,
+        semantic_cache: Optional[SemanticCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        requests_per_minute: Optional[int] = None,
+        client_pool: Optional[MistralClientPool] = None
+    ) -> None:
         """
         Initialize the Mistral client with GitHub token authentication.
         
         Args:
             github_token: GitHub personal access token. If None, will try to get 
                          from GITHUB_TOKEN environment variable.
+            max_cache_entries: Maximum number of responses to cache for repeated
+                               messages. Use 0 to disable caching.
+            semantic_cache: Optional SemanticCache consulted when there is no
+                            exact-match cache hit.
+            disk_cache: Optional DiskCache consulted after the in-memory cache
+                        so responses persist across runs.
+            requests_per_minute: Maximum API requests per minute. If None, will try
+                                 to get from MISTRAL_RPM environment variable;
+                                 requests are not limited if neither is set.
+            client_pool: Optional MistralClientPool used instead of a single
+                         client so requests are spread over several endpoints.
                          
         Raises:
-            ValueError: If no GitHub token is provided or found in environment
+            ValueError: If no GitHub token is provided or found in environment,
+                        or the request rate is not a positive integer
             ImportError: If mistralai library is not installed
             ConnectionError: If unable to initialize the Mistral client
         """
@@ -89,34 +867,60 @@ class MistralGitHubClient:
                 "Invalid GitHub token format. Token should start with 'ghp_', 'gho_', 'ghu_', or 'ghs_'"
             )
         
+        if requests_per_minute is None and os.getenv('MISTRAL_RPM'):
+            try:
+                requests_per_minute = int(os.environ['MISTRAL_RPM'])
+            except ValueError:
+                raise ValueError("MISTRAL_RPM must be a positive integer") from None
+        self.rate_limiter = (
+            TokenBucket(requests_per_minute) if requests_per_minute is not None else None
+        )
+        
+        _load_mistral()
+        
         try:
             # Initialize Mistral client
             # Note: This example assumes Mistral AI supports GitHub token authentication
             # In practice, you might need to use Mistral's own API key system
-            self.client = MistralClient(api_key=self.github_token)
+            self.client = client_pool or _get_shared_client(self.github_token)
             self.is_connected = True
             logger.info("Successfully initialized Mistral AI client")
         except Exception as e:
             self.is_connected = False
             logger.error("Failed to initialize Mistral client")
             raise ConnectionError(f"Unable to initialize Mistral client: {str(e)}") from e
+        
+        # Exact-match response cache keyed by (model, sha256(message))
+        self.max_cache_entries = max_cache_entries
+        self._cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # time.monotonic() of the last successful API call, used by health_check
+        self._last_ok: Optional[float] = None
+        
+        # Background prefetch of follow-up answers in interactive mode
+        self._prefetch_cancel: Optional[threading.Event] = None
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self.semantic_cache = semantic_cache
+        self.disk_cache = disk_cache
     
-    def _validate_token_format(self, token: str) -> bool:
+    @staticmethod
+    def _validate_token_format(token: str) -> bool:
         """
         Validate that the token follows GitHub's token format.
         
+        This is a startup check, called exactly once per client construction;
+        nothing on the per-request path validates the token again.
+        
         Args:
             token: The token to validate
             
         Returns:
             bool: True if token format is valid, False otherwise
         """
-        if not token or not isinstance(token, str):
-            return False
-        
-        # GitHub tokens have specific prefixes
-        valid_prefixes = ['ghp_', 'gho_', 'ghu_', 'ghs_']
-        return any(token.startswith(prefix) for prefix in valid_prefixes) and len(token) > 10
+        return (
+            isinstance(token, str) and len(token) > 10 and token.startswith(_VALID_TOKEN_PREFIXES)
+        )
     
     def _sanitize_message(self, message: str) -> str:
         """
@@ -128,23 +932,22 @@ class MistralGitHubClient:
         Returns:
             str: The sanitized message
         """
-        # Remove potential tokens or sensitive patterns
-        import re
-        sanitized = re.sub(r'gh[a-z]_[A-Za-z0-9_]{36,}', '[REDACTED_TOKEN]', message)
-        sanitized = re.sub(r'sk-[A-Za-z0-9]{48,}', '[REDACTED_API_KEY]', sanitized)
-        return sanitized
+        # Remove potential tokens or sensitive patterns in a single pass
+        return _SANITIZE_RE.sub(
+            lambda m: '[REDACTED_TOKEN]' if m.group(1) else '[REDACTED_API_KEY]', message
+        )
         
-    def send_chat_message(self, message: str, model: str = "mistral-tiny") -> Dict[str, Any]:
+    def _prepare_message(self, message: str, model: str) -> str:
         """
-        Send a chat message to the Mistral AI model.
+        Validate an outgoing message and log its sanitized form.
         
         Args:
             message: The message to send to the AI model
-            model: The Mistral model to use (default: "mistral-tiny")
-            
+            model: The Mistral model the message is addressed to
+        
         Returns:
-            Dict containing 'success', 'response', and optionally 'error' keys
-            
+            str: The message with surrounding whitespace removed
+        
         Raises:
             ValueError: If message is empty or invalid
             ConnectionError: If not connected to Mistral AI
@@ -152,37 +955,274 @@ class MistralGitHubClient:
         if not self.is_connected:
             raise ConnectionError("Not connected to Mistral AI. Please reinitialize the client.")
         
-        if not message or not message.strip():
+        message = message.strip() if message else message
+        if not message:
             raise ValueError("Message cannot be empty")
         
-        if len(message.strip()) > 10000:  # Reasonable message length limit
+        if len(message) > 10000:  # Reasonable message length limit
             raise ValueError("Message too long. Please limit to 10,000 characters.")
         
         # Sanitize message for logging
         sanitized_message = self._sanitize_message(message)
         logger.info(f"Sending message to model '{model}': {sanitized_message[:100]}...")
+        return message
+    
+    def _cache_key(
+        self, message: str, model: str, max_tokens: Optional[int], system_prompt: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        Build the response cache key for a message.
+        
+        Args:
+            message: The stripped message sent to the AI model
+            model: The Mistral model the message is addressed to
+            max_tokens: The response length limit the message is sent with
+            system_prompt: The system prompt the message is sent with
+        
+        Returns:
+            Tuple of the model name and the SHA-256 digest of the message and settings
+        """
+        digest = hashlib.sha256(message.encode('utf-8'))
+        digest.update(f"\0{max_tokens}\0{system_prompt}".encode('utf-8'))
+        return (model, digest.hexdigest())
+    
+    @staticmethod
+    def _semantic_partition(
+        model: str, max_tokens: Optional[int], system_prompt: Optional[str]
+    ) -> str:
+        """
+        Build the semantic cache partition for a request.
+        
+        Like the exact-match key, the partition covers the generation settings,
+        so a paraphrase is only answered with a reply produced under the same ones.
+        
+        Args:
+            model: The Mistral model the message is addressed to
+            max_tokens: The response length limit the message is sent with
+            system_prompt: The system prompt the message is sent with
+        
+        Returns:
+            str: The partition name
+        """
+        return f"{model}\0{max_tokens}\0{system_prompt}"
+    
+    def _get_cached_response(
+        self, key: Tuple[str, str], message: str, partition: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Any]]:
+        """
+        Look up a previously successful response, exactly or semantically.
+        
+        Args:
+            key: Cache key from _cache_key
+            message: The stripped message sent to the AI model
+            partition: Semantic cache partition from _semantic_partition
+        
+        Returns:
+            Tuple of a copy of the cached result marked with 'cached': True (or None
+            on a miss) and the message embedding if the semantic cache was consulted
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            logger.info("Returning cached response")
+            return dict(cached, cached=True), None
+        
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(key)
+            if cached is not None:
+                logger.info("Returning response from disk cache")
+                self._store_in_memory(key, cached)
+                return dict(cached, cached=True), None
+        
+        if self.semantic_cache is None:
+            return None, None
+        
+        embedding = self.semantic_cache.encode(message)
+        with self._cache_lock:
+            similar = self.semantic_cache.lookup(embedding, partition)
+        if similar is not None:
+            logger.info("Returning semantically cached response")
+            return dict(similar, cached=True), embedding
+        return None, embedding
+    
+    def _store_response(
+        self,
+        key: Tuple[str, str],
+        result: Dict[str, Any],
+        embedding: Optional[Any] = None,
+        partition: Optional[str] = None
+    ) -> None:
+        """
+        Store a successful response in every configured cache.
+        
+        Args:
+            key: Cache key from _cache_key
+            result: The successful result dict to cache
+            embedding: The message embedding to index in the semantic cache
+            partition: Semantic cache partition from _semantic_partition, required
+                       with an embedding
+        """
+        if embedding is not None:
+            with self._cache_lock:
+                self.semantic_cache.add(embedding, partition, result)
+        
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, result)
+        
+        self._store_in_memory(key, result)
+    
+    def _store_in_memory(self, key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        """
+        Store a response in the exact-match cache, evicting the least recently used entries.
+        
+        Args:
+            key: Cache key from _cache_key
+            result: The successful result dict to cache
+        """
+        if self.max_cache_entries <= 0:
+            return
+        
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+    
+    def _iter_response_tokens(
+        self, messages: Tuple[Any, ...], model: str, max_tokens: Optional[int]
+    ) -> Iterator[str]:
+        """
+        Stream the response to already validated chat messages.
+        
+        Args:
+            messages: The chat messages to send to the AI model
+            model: The Mistral model to use
+            max_tokens: Maximum number of tokens to generate, or None for no limit
+        
+        Yields:
+            str: Response content deltas as they arrive
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        
+        # Stream the response from Mistral AI
+        for chunk in self.client.chat_stream(model=model, messages=messages, max_tokens=max_tokens):
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+        
+        self._last_ok = time.monotonic()
+        logger.info("Successfully received response from Mistral AI")
+    
+    def _iter_and_cache_tokens(
+        self,
+        messages: Tuple[Any, ...],
+        model: str,
+        max_tokens: Optional[int],
+        key: Tuple[str, str],
+        embedding: Optional[Any],
+        partition: str
+    ) -> Iterator[str]:
+        """
+        Stream the response to chat messages and cache it once fully received.
+        
+        Args:
+            messages: The chat messages to send to the AI model
+            model: The Mistral model to use
+            max_tokens: Maximum number of tokens to generate, or None for no limit
+            key: Cache key from _cache_key
+            embedding: The message embedding for the semantic cache, if any
+            partition: Semantic cache partition from _semantic_partition
+        
+        Yields:
+            str: Response content deltas as they arrive
+        """
+        parts = []
+        for token in self._iter_response_tokens(messages, model, max_tokens):
+            parts.append(token)
+            yield token
+        
+        self._store_response(key, {
+            'success': True,
+            'response': "".join(parts),
+            'model_used': model
+        }, embedding, partition)
+    
+    def send_chat_message_stream(
+        self,
+        message: str,
+        model: str = MODELS_BY_USE_CASE["realtime_chat"],
+        max_tokens: Optional[int] = _DEFAULT_MAX_TOKENS,
+        system_prompt: Optional[str] = _DEFAULT_SYSTEM_PROMPT
+    ) -> Iterator[str]:
+        """
+        Send a chat message and stream the response as it is generated.
+        
+        The message is validated immediately; API errors are raised while
+        iterating over the returned tokens. Cached responses are yielded
+        as a single token.
+        
+        Args:
+            message: The message to send to the AI model
+            model: The Mistral model to use (default: "mistral-small-latest")
+            max_tokens: Maximum number of tokens to generate (default: 150), or None for no limit
+            system_prompt: System instruction sent before the message, or None to omit it
+        
+        Returns:
+            Iterator over the response content deltas
+        
+        Raises:
+            ValueError: If message is empty or invalid
+            ConnectionError: If not connected to Mistral AI
+        """
+        message = self._prepare_message(message, model)
+        
+        key = self._cache_key(message, model, max_tokens, system_prompt)
+        partition = self._semantic_partition(model, max_tokens, system_prompt)
+        cached, embedding = self._get_cached_response(key, message, partition)
+        if cached is not None:
+            return iter([cached['response']])
+        
+        messages = _build_messages(message, system_prompt)
+        return self._iter_and_cache_tokens(messages, model, max_tokens, key, embedding, partition)
+    
+    def send_chat_message(
+        self,
+        message: str,
+        model: str = MODELS_BY_USE_CASE["realtime_chat"],
+        max_tokens: Optional[int] = _DEFAULT_MAX_TOKENS,
+        system_prompt: Optional[str] = _DEFAULT_SYSTEM_PROMPT
+    ) -> Dict[str, Any]:
+        """
+        Send a chat message to the Mistral AI model.
+        
+        Args:
+            message: The message to send to the AI model
+            model: The Mistral model to use (default: "mistral-small-latest")
+            max_tokens: Maximum number of tokens to generate (default: 150), or None for no limit
+            system_prompt: System instruction sent before the message, or None to omit it
+        
+        Returns:
+            Dict containing 'success', 'response', 'cached', and optionally 'error' keys
+        
+        Raises:
+            ValueError: If message is empty or invalid
+            ConnectionError: If not connected to Mistral AI
+        """
+        message = self._prepare_message(message, model)
+        
+        key = self._cache_key(message, model, max_tokens, system_prompt)
+        partition = self._semantic_partition(model, max_tokens, system_prompt)
+        cached, embedding = self._get_cached_response(key, message, partition)
+        if cached is not None:
+            return cached
         
         try:
-            # Create the chat message
-            messages = [
-                ChatMessage(role="user", content=message.strip())
-            ]
-            
-            # Send the message to Mistral AI
-            chat_response = self.client.chat(
-                model=model,
-                messages=messages,
-            )
-            
-            # Extract and return the response
-            response_content = chat_response.choices[0].message.content
-            logger.info("Successfully received response from Mistral AI")
-            
-            return {
-                'success': True,
-                'response': response_content,
-                'model_used': model
-            }
+            # Accumulate the streamed response
+            messages = _build_messages(message, system_prompt)
+            response_content = "".join(self._iter_response_tokens(messages, model, max_tokens))
             
         except Exception as e:
             error_msg = f"Error communicating with Mistral AI: {str(e)}"
@@ -192,6 +1232,15 @@ class MistralGitHubClient:
                 'error': error_msg,
                 'model_used': model
             }
+        
+        # Build the result before caching it, so a cache failure cannot replace the reply
+        result = {
+            'success': True,
+            'response': response_content,
+            'model_used': model
+        }
+        self._store_response(key, result, embedding, partition)
+        return dict(result, cached=False)
     
     def get_available_models(self) -> List[str]:
         """
@@ -202,6 +1251,8 @@ class MistralGitHubClient:
         """
         # Default models - in practice, this could query the API for available models
         return [
+            "mistral-small-latest",
+            "mistral-large-latest",
             "mistral-tiny",
             "mistral-small", 
             "mistral-medium",
@@ -212,103 +1263,506 @@ class MistralGitHubClient:
         """
         Perform a health check to verify the connection is working.
         
+        A successful API call within the last minute counts as healthy;
+        otherwise the lightweight models endpoint is queried instead of
+        generating a chat completion.
+        
         Returns:
             bool: True if connection is healthy, False otherwise
         """
+        if not self.is_connected:
+            return False
+        
+        if self._last_ok is not None and time.monotonic() - self._last_ok < _HEALTH_CHECK_TTL:
+            return True
+        
         try:
-            result = self.send_chat_message("Hello")
-            return result['success']
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self.client.list_models()
+            self._last_ok = time.monotonic()
+            return True
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return False
     
+    async def _send_async(
+        self, message: str, model: str = MODELS_BY_USE_CASE["realtime_chat"]
+    ) -> Dict[str, Any]:
+        """
+        Send a chat message from a worker thread so requests can run concurrently.
+        
+        Args:
+            message: The message to send to the AI model
+            model: The Mistral model to use (default: "mistral-small-latest")
+            
+        Returns:
+            Dict containing 'success', 'response', 'cached', and optionally 'error' keys
+        """
+        return await asyncio.to_thread(self.send_chat_message, message, model)
+    
+    async def _gather_demo_results(self, messages: List[str]) -> List[Any]:
+        """
+        Send messages concurrently and collect their results in order.
+        
+        Args:
+            messages: The messages to send to the AI model
+            
+        Returns:
+            List of result dicts, or the exception raised for a message
+        """
+        return await asyncio.gather(
+            *[
+                self._send_async(message, MODELS_BY_USE_CASE["realtime_chat"])
+                for message in messages
+            ],
+            return_exceptions=True
+        )
+    
+    def _gather_demo_results_sync(self, messages: List[str]) -> List[Any]:
+        """
+        Run _gather_demo_results from synchronous code.
+        
+        asyncio.run cannot be called while an event loop is running (e.g. in
+        Jupyter), so in that case the requests run on a new loop in a worker thread.
+        
+        Args:
+            messages: The messages to send to the AI model
+            
+        Returns:
+            List of result dicts, or the exception raised for a message
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._gather_demo_results(messages))
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._gather_demo_results(messages)).result()
+    
+    def _send_combined_messages(self, messages: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Ask several independent questions in a single request.
+        
+        The questions are numbered in one prompt and the numbered answers are
+        split back out, so the fixed per-request overhead is only paid once.
+        
+        Args:
+            messages: The questions to send to the AI model
+            
+        Returns:
+            One result dict per message, or None if the response could not be
+            split into one answer per question
+        """
+        prompt = _COMBINED_PROMPT_HEADER + "\n".join(
+            f"{i}. {message}" for i, message in enumerate(messages, 1)
+        )
+        # The prompt already asks for brief answers; allow the usual budget per question
+        result = self.send_chat_message(
+            prompt, max_tokens=_DEFAULT_MAX_TOKENS * len(messages), system_prompt=None
+        )
+        if not result['success']:
+            return [result] * len(messages)
+        
+        # re.split with a capture group alternates: [preamble, '1', answer, '2', answer, ...]
+        parts = _ANSWER_PREFIX_RE.split(result['response'])
+        answers = {int(number): answer.strip() for number, answer in zip(parts[1::2], parts[2::2])}
+        if sorted(answers) != list(range(1, len(messages) + 1)):
+            logger.warning("Could not split combined response; sending messages individually")
+            return None
+        
+        return [
+            dict(result, response=answers[i])
+            for i in range(1, len(messages) + 1)
+        ]
+    
+    def _batch_request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """
+        Send a Batch API request over the Mistral client's HTTP session.
+        
+        The 0.x MistralClient has no batch methods, and its FilesClient only
+        accepts fine-tuning uploads, so the REST endpoints are called directly
+        with the client's connection pool and credentials.
+        
+        Args:
+            method: The HTTP method
+            path: The API path, e.g. "v1/batch/jobs"
+            **kwargs: Passed on to httpx.Client.request
+            
+        Returns:
+            httpx.Response: The successful response
+            
+        Raises:
+            ConnectionError: If the API returns an error status
+        """
+        response = self.client._client.request(
+            method,
+            f"{self.client._endpoint.rstrip('/')}/{path}",
+            headers={"Authorization": f"Bearer {self.github_token}"},
+            **kwargs
+        )
+        if response.status_code >= 400:
+            raise ConnectionError(
+                f"Batch API request {method.upper()} {path} failed with status "
+                f"{response.status_code}"
+            )
+        return response
+    
+    def _send_batch_messages(
+        self,
+        messages: List[str],
+        model: str = MODELS_BY_USE_CASE["realtime_chat"],
+        timeout: float = _BATCH_TIMEOUT
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answer several messages with a Batch API job.
+        
+        Batch jobs are billed at a lower rate than real-time requests but may
+        take minutes to complete, so this is only suited to non-interactive use.
+        
+        Args:
+            messages: The messages to send to the AI model
+            model: The Mistral model to use
+            timeout: Seconds to wait for the job before giving up
+            
+        Returns:
+            One result dict per message, or None if the client has no HTTP
+            session to send batch requests over (e.g. a MistralClientPool)
+            
+        Raises:
+            ConnectionError: If a request fails or the job does not finish successfully
+            TimeoutError: If the batch job does not finish within the timeout
+        """
+        if getattr(self.client, '_client', None) is None or \
+                getattr(self.client, '_endpoint', None) is None:
+            return None
+        
+        batch_lines = [
+            json.dumps({
+                'custom_id': str(i),
+                'body': {
+                    'max_tokens': _DEFAULT_MAX_TOKENS,
+                    'messages': [
+                        {'role': 'system', 'content': _DEFAULT_SYSTEM_PROMPT},
+                        {'role': 'user', 'content': message},
+                    ],
+                },
+            })
+            for i, message in enumerate(messages)
+        ]
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        upload = self._batch_request(
+            "post", "v1/files",
+            files={'file': ('demo_batch.jsonl', "\n".join(batch_lines).encode('utf-8'))},
+            data={'purpose': 'batch'}
+        ).json()
+        job = self._batch_request("post", "v1/batch/jobs", json={
+            'input_files': [upload['id']],
+            'model': model,
+            'endpoint': '/v1/chat/completions',
+        }).json()
+        logger.info(f"Submitted batch job {job['id']}")
+        
+        # Poll with exponential backoff; jobs usually take minutes, not seconds
+        deadline = time.monotonic() + timeout
+        delay = _BATCH_POLL_INTERVAL
+        while job['status'] in _BATCH_PENDING_STATUSES:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Batch job {job['id']} did not finish within {timeout:.0f} seconds"
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_INTERVAL)
+            job = self._batch_request("get", f"v1/batch/jobs/{job['id']}").json()
+        
+        if job['status'] != "SUCCESS" or not job.get('output_file'):
+            raise ConnectionError(f"Batch job {job['id']} finished with status {job['status']}")
+        
+        results = [
+            {'success': False, 'error': "No result returned by the batch job", 'model_used': model}
+            for _ in messages
+        ]
+        output = self._batch_request("get", f"v1/files/{job['output_file']}/content").text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = int(record['custom_id'])
+            response = record.get('response') or {}
+            if record.get('error') or response.get('status_code') != 200:
+                results[index] = {
+                    'success': False,
+                    'error': f"Batch request failed: {record.get('error') or response.get('body')}",
+                    'model_used': model
+                }
+                continue
+            
+            results[index] = {
+                'success': True,
+                'response': response['body']['choices'][0]['message']['content'],
+                'model_used': model
+            }
+            # Later real-time runs of the same messages are answered from the cache
+            key = self._cache_key(
+                messages[index], model, _DEFAULT_MAX_TOKENS, _DEFAULT_SYSTEM_PROMPT
+            )
+            self._store_response(key, results[index])
+        
+        self._last_ok = time.monotonic()
+        return results
+    
+    def _print_demo_results(self, messages: List[str], results: List[Any]) -> None:
+        """
+        Display each demo message with its response.
+        
+        Args:
+            messages: The demo messages that were sent
+            results: Result dict or exception for each message
+        """
+        for i, (message, result) in enumerate(zip(messages, results), 1):
+            lines = ["", f"📝 Demo Message {i}: {message}"]
+            
+            if isinstance(result, Exception):
+                lines.append(f"❌ Unexpected error: {result}")
+            elif result['success']:
+                response = result['response']
+                display = response if len(response) <= 200 else response[:200] + "..."
+                lines.append(f"✅ Response: {display}")
+            else:
+                lines.append(f"❌ Error: {result['error']}")
+            
+            # One write per message instead of one per line
+            sys.stdout.write("\n".join(lines) + "\n")
+    
+    async def demonstrate_interaction_async(self) -> None:
+        """
+        Demonstrate basic interaction with the Mistral AI model.
+        
+        All example messages are sent as separate concurrent requests, so the
+        demo takes as long as the slowest response rather than the sum of all of them.
+        """
+        print("🤖 Mistral AI GitHub Integration Demo")
+        print("=" * 40)
+        
+        print(f"\n🔄 Sending {len(_DEMO_MESSAGES)} messages to Mistral AI...")
+        results = await self._gather_demo_results(_DEMO_MESSAGES)
+        self._print_demo_results(_DEMO_MESSAGES, results)
+    
     def demonstrate_interaction(self) -> None:
         """
         Demonstrate basic interaction with the Mistral AI model.
         
         This method runs through several example messages to showcase
-        the client's functionality and provide sample outputs.
+        the client's functionality and provide sample outputs. The messages
+        are sent as one combined request; if the answers cannot be split
+        apart, they are sent concurrently as separate requests instead.
         """
         print("🤖 Mistral AI GitHub Integration Demo")
         print("=" * 40)
         
-        # Example messages to demonstrate the functionality
-        demo_messages = [
-            "Hello, can you help me with a simple coding question?",
-            "What are the best practices for writing secure smart contracts?",
-            "Explain the difference between ERC-20 and ERC-721 tokens."
-        ]
+        print(f"\n🔄 Sending {len(_DEMO_MESSAGES)} messages to Mistral AI in one request...")
+        try:
+            results = self._send_combined_messages(_DEMO_MESSAGES)
+        except Exception as e:
+            results = [e] * len(_DEMO_MESSAGES)
+        
+        if results is None:
+            results = self._gather_demo_results_sync(_DEMO_MESSAGES)
+        
+        self._print_demo_results(_DEMO_MESSAGES, results)
+    
+    def demonstrate_interaction_batch(self) -> None:
+        """
+        Run the demonstration as a Batch API job.
+        
+        The demo is not latency-sensitive, so submitting it as a batch job
+        trades a slower answer for lower cost, e.g. when CI runs the demo
+        repeatedly. Falls back to demonstrate_interaction if the installed
+        client does not support the Batch API.
+        """
+        try:
+            results = self._send_batch_messages(_DEMO_MESSAGES)
+        except Exception as e:
+            results = [e] * len(_DEMO_MESSAGES)
+        
+        if results is None:
+            print("⚠️  Batch API not supported by this client; sending requests directly.")
+            self.demonstrate_interaction()
+            return
         
-        for i, message in enumerate(demo_messages, 1):
-            print(f"\n📝 Demo Message {i}: {message}")
-            print("🔄 Sending to Mistral AI...")
+        print("🤖 Mistral AI GitHub Integration Demo (batch)")
+        print("=" * 40)
+        self._print_demo_results(_DEMO_MESSAGES, results)
+    
+    def _prefetch_follow_ups(
+        self, question: str, answer: str, model: str, cancel: threading.Event
+    ) -> None:
+        """
+        Warm the response caches with answers to likely follow-up questions.
+        
+        A lightweight model suggests follow-up questions, which are then sent
+        to the same model as the original question. Their answers land in the
+        semantic cache, so a follow-up the user phrases differently is still
+        answered from it.
+        
+        Args:
+            question: The question the user just asked
+            answer: The response the user is reading
+            model: The model used for the original question
+            cancel: Event set when the user starts a new query
+        """
+        try:
+            prompt = _FOLLOW_UP_PROMPT.format(
+                question=question, answer=answer[:1000], count=_PREFETCH_COUNT
+            )
+            result = self.send_chat_message(
+                prompt, MODELS_BY_USE_CASE["lightweight"], system_prompt=None
+            )
+            if not result['success']:
+                return
             
-            try:
-                result = self.send_chat_message(message)
-                if result['success']:
-                    response = result['response']
-                    display_response = (
-                        f"{response[:200]}..." if len(response) > 200 else response
-                    )
-                    print(f"✅ Response: {display_response}")
-                else:
-                    print(f"❌ Error: {result['error']}")
-            except Exception as e:
-                print(f"❌ Unexpected error: {e}")
+            follow_ups = [
+                _LIST_ITEM_RE.sub('', line).strip()
+                for line in result['response'].splitlines()
+            ]
+            for follow_up in [q for q in follow_ups if q][:_PREFETCH_COUNT]:
+                if cancel.is_set():
+                    return
+                self.send_chat_message(follow_up, model)
+        except Exception as e:
+            logger.warning(f"Prefetching follow-up questions failed: {e}")
+    
+    def _start_prefetch(self, question: str, answer: str, model: str) -> None:
+        """
+        Prefetch follow-up answers in a background thread while the user reads.
+        
+        Args:
+            question: The question the user just asked
+            answer: The response the user is reading
+            model: The model used for the original question
+        """
+        self._cancel_prefetch()
+        self._prefetch_cancel = threading.Event()
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_follow_ups,
+            args=(question, answer, model, self._prefetch_cancel),
+            name=_PREFETCH_THREAD_NAME,
+            daemon=True
+        )
+        self._prefetch_thread.start()
     
-    def interactive_mode(self) -> None:
+    def _cancel_prefetch(self) -> None:
+        """Stop any running prefetch from sending further requests."""
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+    
+    def interactive_mode(self, prefetch: bool = False) -> None:
         """
         Start an interactive chat session with Mistral AI.
         
         This method provides a command-line interface for real-time
         interaction with the Mistral AI model. Users can type messages
         and receive responses until they choose to exit.
+        
+        Args:
+            prefetch: Whether to answer likely follow-up questions in the
+                      background while the user reads each response. This
+                      makes extra API requests and needs a semantic cache.
+        
+        Raises:
+            ValueError: If prefetch is requested without a semantic cache
         """
+        if prefetch and self.semantic_cache is None:
+            raise ValueError("Prefetching follow-up questions requires a semantic cache")
+        
         print("\n🚀 Interactive Mode - Type 'quit' or 'exit' to end the session")
-        print("Commands: 'help', 'models', 'health', 'quit'")
+        print("Commands: 'help', 'models', 'health', 'reason <question>', 'quit'")
         print("=" * 60)
         
+        commands = self._command_handlers()
         while True:
             try:
                 user_input = input("\n💬 You: ").strip()
                 
                 if user_input.lower() in ['quit', 'exit', 'q']:
+                    self._cancel_prefetch()
                     print("👋 Goodbye!")
                     break
-                elif user_input.lower() == 'help':
-                    self._show_help()
-                    continue
-                elif user_input.lower() == 'models':
-                    self._show_models()
-                    continue
-                elif user_input.lower() == 'health':
-                    self._show_health_status()
+                
+                handler = commands.get(user_input.lower())
+                if handler is not None:
+                    handler()
                     continue
                 
                 if not user_input:
                     print("Please enter a message or command.")
                     continue
                 
+                # Use the fast chat model unless the user asks for deeper reasoning
+                model = MODELS_BY_USE_CASE["realtime_chat"]
+                command, _, question = user_input.partition(" ")
+                if command.lower() == 'reason':
+                    if not question.strip():
+                        print("Please enter a question after 'reason'.")
+                        continue
+                    user_input = question
+                    model = MODELS_BY_USE_CASE["reasoning"]
+                
+                self._cancel_prefetch()
                 print("🔄 Mistral AI is thinking...")
-                result = self.send_chat_message(user_input)
+                tokens = self.send_chat_message_stream(user_input, model)
                 
-                if result['success']:
-                    print(f"🤖 Mistral AI: {result['response']}")
-                else:
-                    print(f"❌ Error: {result['error']}")
+                # Print tokens as they arrive instead of waiting for the full response,
+                # flushing on the first token, on line breaks and every few tokens
+                sys.stdout.write("🤖 Mistral AI: ")
+                parts = []
+                try:
+                    for count, token in enumerate(tokens):
+                        parts.append(token)
+                        sys.stdout.write(token)
+                        if count % _STREAM_FLUSH_EVERY == 0 or "\n" in token:
+                            sys.stdout.flush()
+                    sys.stdout.write("\n")
+                    sys.stdout.flush()
+                except Exception as e:
+                    error_msg = f"Error communicating with Mistral AI: {str(e)}"
+                    logger.error(error_msg)
+                    print(f"\n❌ Error: {error_msg}")
+                    continue
                 
+                if prefetch:
+                    self._start_prefetch(user_input, "".join(parts), model)
+            
             except KeyboardInterrupt:
+                self._cancel_prefetch()
                 print("\n\n👋 Session ended by user. Goodbye!")
                 break
             except Exception as e:
                 print(f"❌ Unexpected error: {e}")
     
+    def _command_handlers(self) -> Dict[str, Any]:
+        """
+        Map interactive mode commands to the methods that handle them.
+        
+        Returns:
+            Dict of lowercase command name to a callable taking no arguments
+        """
+        return {
+            'help': self._show_help,
+            'models': self._show_models,
+            'health': self._show_health_status,
+        }
+    
     def _show_help(self) -> None:
         """Display help information for interactive mode."""
         print("\n📋 Available Commands:")
         print("  help    - Show this help message")
         print("  models  - List available models")
         print("  health  - Check connection health")
+        print("  reason  - Ask a question using the reasoning model (e.g. 'reason why?')")
         print("  quit    - Exit interactive mode")
         print("\nJust type any message to chat with Mistral AI!")
     
@@ -327,16 +1781,25 @@ class MistralGitHubClient:
             print("❌ Connection issues detected. Please check your token and network.")
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main function to run the Mistral AI client demonstration.
     
+    Args:
+        argv: Command line arguments (default: sys.argv[1:]). Pass --batch to
+              run the demo as a Batch API job and skip interactive mode, or
+              --prefetch to prefetch follow-up answers in interactive mode.
+    
     Returns:
         int: Exit code (0 for success, 1 for error)
     """
     print("🔧 Mistral AI Client - GitHub Integration")
     print("========================================")
     
+    args = sys.argv[1:] if argv is None else argv
+    batch = '--batch' in args
+    prefetch = '--prefetch' in args
+    
     # Check if GitHub token is available
     github_token = os.getenv('GITHUB_TOKEN')
     if not github_token:
@@ -352,9 +1815,25 @@ def main() -> int:
     
     try:
         # Initialize the client
-        client = MistralGitHubClient()
+        # Prefetched answers are only found again through the semantic cache
+        semantic_cache = None
+        if prefetch:
+            try:
+                semantic_cache = SemanticCache()
+            except ImportError as e:
+                print(f"⚠️  Prefetching disabled: {e}")
+                prefetch = False
+        
+        client = MistralGitHubClient(semantic_cache=semantic_cache)
         print("✅ Successfully initialized Mistral AI client with GitHub authentication")
         
+        # Reuse responses from previous runs when the cache is available. It is only
+        # opened once the client is set up, so failed runs leave no database behind
+        try:
+            client.disk_cache = DiskCache()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache unavailable: {e}")
+        
         # Perform health check
         print("\n🏥 Performing health check...")
         if not client.health_check():
@@ -364,6 +1843,11 @@ def main() -> int:
         
         # Run demonstration
         print("\n🎯 Running demonstration...")
+        if batch:
+            # Batch runs are meant for unattended use such as CI, so skip the prompt
+            client.demonstrate_interaction_batch()
+            print("✅ Demo completed successfully!")
+            return 0
         client.demonstrate_interaction()
         
         # Ask if user wants interactive mode
@@ -371,7 +1855,7 @@ def main() -> int:
             try:
                 choice = input("\n❓ Would you like to start interactive mode? (y/n): ").strip().lower()
                 if choice in ['y', 'yes']:
-                    client.interactive_mode()
+                    client.interactive_mode(prefetch=prefetch)
                     break
                 elif choice in ['n', 'no']:
                     print("✅ Demo completed successfully!")